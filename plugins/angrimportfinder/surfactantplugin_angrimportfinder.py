@@ -3,7 +3,9 @@
 #
 # SPDX-License-Identifier: MIT
 import json
+import os
 from pathlib import Path
+from typing import List
 
 import angr
 from cle import CLECompatibilityError
@@ -25,66 +27,45 @@ def angrimport_finder(sbom: SBOM, software: Software, filename: str, filetype: s
     """
 
     # Only parsing executable files
-    if filetype not in ["ELF", "PE"]:
-        pass
+    if filetype not in ("ELF", "PE"):
+        return None
     filehash = str(software.sha256)
-    filename = Path(filename)
-    flist = []
+    base_name = os.path.basename(filename)
 
-    # Performing check to see if file has been analyzed already
-    existing_json = None
-    output_name = None
-    for f in Path.cwd().glob("*.json"):
-        flist.append((f.stem).split("_")[0])
-        if filehash == (f.stem).split("_")[0]:
-            existing_json = f
-            output_name = f
+    # Performing check to see if file has been analyzed already; output files are named by hash,
+    # so look for this file's output directly instead of scanning every JSON file in the directory
+    output_path = Path.cwd() / f"{filehash}_additional_metadata.json"
 
-    if existing_json:
-        with open(existing_json, "r") as json_file:
+    if output_path.exists():
+        with open(output_path, "r") as json_file:
             existing_data = json.load(json_file)
         if "imported function names" in existing_data:
-            logger.info(f"Already extracted {filename.name}")
+            logger.info(f"Already extracted {base_name}")
         else:
             try:
                 logger.info(
-                    f"Found existing JSON file for {filename.name} but without 'imported functions' key. Proceeding with extraction."
+                    f"Found existing JSON file for {base_name} but without 'imported functions' key. Proceeding with extraction."
                 )
                 # Add your extraction code here.
-                if filename.name not in existing_data["filename"]:
-                    existing_data["filename"].append(filename.name)
-                existing_data["imported function names"] = []
-                # Create an angr project
-                project = angr.Project(filename, auto_load_libs=False)
-
-                # Get the imported functions using symbol information
-                for symbol in project.loader.main_object.symbols:
-                    if symbol.is_function:
-                        existing_data["imported function names"].append(symbol.name)
+                if base_name not in existing_data["filename"]:
+                    existing_data["filename"].append(base_name)
+                existing_data["imported function names"] = get_function_names(filename)
 
                 # Write the string_dict to the output JSON file
-                with open(output_name, "w") as json_file:
+                with open(output_path, "w") as json_file:
                     json.dump(existing_data, json_file, indent=4)
             except CLECompatibilityError as e:
                 logger.info(f"Angr Error {filename} {e}")
     else:
         try:
             # Validate the file path
-            if not filename.exists():
+            if not os.path.isfile(filename):
                 raise FileNotFoundError(f"No such file: '{filename}'")
 
-            # Extract filename without extension
-            output_path = Path.cwd() / f"{filehash}_additional_metadata.json"
             metadata = {}
             metadata["sha256hash"] = filehash
-            metadata["filename"] = [filename.name]
-            metadata["imported function names"] = []
-            # Create an angr project
-            project = angr.Project(filename.as_posix(), auto_load_libs=False)
-            # Get the imported functions using symbol information
-            for symbol in project.loader.main_object.symbols:
-                if symbol.is_function:
-                    metadata["imported function names"].append(symbol.name)
+            metadata["filename"] = [base_name]
+            metadata["imported function names"] = get_function_names(filename)
 
             # Write the string_dict to the output JSON file
             with open(output_path, "w") as json_file:
@@ -93,3 +74,10 @@ def angrimport_finder(sbom: SBOM, software: Software, filename: str, filetype: s
             logger.info(f"Data written to {output_path}")
         except CLECompatibilityError as e:
             logger.info(f"Angr Error {filename} {e}")
+
+
+def get_function_names(filename: str) -> List[str]:
+    # Create an angr project
+    project = angr.Project(filename, auto_load_libs=False)
+    # Get the imported functions using symbol information
+    return [symbol.name for symbol in project.loader.main_object.symbols if symbol.is_function]
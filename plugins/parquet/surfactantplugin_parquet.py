@@ -0,0 +1,70 @@
+# Copyright 2024 Lawrence Livermore National Security, LLC
+# See the top-level LICENSE file for details.
+#
+# SPDX-License-Identifier: MIT
+from typing import Dict, List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import surfactant.plugin
+from surfactant.output.csv_writer import field_name_map, get_software_field
+from surfactant.sbomtypes import SBOM, Software
+
+# Same columns as the CSV output, stored column-wise with types instead of as text
+SCHEMA = pa.schema(
+    [
+        ("Path", pa.string()),
+        ("SHA1", pa.string()),
+        ("SHA256", pa.string()),
+        ("MD5", pa.string()),
+        ("Supplier", pa.list_(pa.string())),
+        ("Product", pa.string()),
+        ("Version", pa.string()),
+        ("Description", pa.string()),
+        ("Copyright", pa.string()),
+    ]
+)
+
+
+@surfactant.plugin.hookimpl
+def write_sbom(sbom: SBOM, outfile) -> None:
+    """Writes the software entries in an SBOM to a Parquet file, with one row per install path
+    (or container path, or file name, if a software entry has no install paths).
+
+    Args:
+        sbom (SBOM): The SBOM to write to the output file.
+        outfile: The output file handle to write the SBOM to.
+    """
+    columns: Dict[str, list] = {name: [] for name in SCHEMA.names}
+    for sw in sbom.software:
+        paths = get_paths(sw)
+        columns["Path"] += paths
+        # look up the other columns the same way as the CSV output does
+        for name in SCHEMA.names:
+            if name == "Path":
+                continue
+            value = get_software_field(sw, field_name_map.get(name, name))
+            columns[name] += [value] * len(paths)
+
+    table = pa.Table.from_pydict(columns, schema=SCHEMA)
+    # Parquet is a binary format; write to the underlying binary stream of text mode files
+    if hasattr(outfile, "buffer"):
+        outfile.flush()
+        outfile = outfile.buffer
+    pq.write_table(table, outfile, compression="zstd")
+
+
+@surfactant.plugin.hookimpl
+def short_name() -> Optional[str]:
+    return "parquet"
+
+
+def get_paths(software: Software) -> List[str]:
+    if software.installPath:
+        return list(software.installPath)
+    # remove the UUID portion at the start of container paths
+    if software.containerPath:
+        return [p.partition("/")[2] for p in software.containerPath]
+    # last resort, use the fileName instead of an actual path
+    return list(software.fileName or [])
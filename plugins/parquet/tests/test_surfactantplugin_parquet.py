@@ -0,0 +1,54 @@
+# Copyright 2024 Lawrence Livermore National Security, LLC
+# See the top-level LICENSE file for details.
+#
+# SPDX-License-Identifier: MIT
+import sys
+from pathlib import Path
+
+import pytest
+
+from surfactant.sbomtypes import SBOM, Software
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+# make the plugin importable when running pytest from the repository root without installing it
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import surfactantplugin_parquet  # noqa: E402
+
+
+def test_parquet_output(tmp_path):
+    sbom = SBOM()
+    sbom.add_software(
+        Software(
+            sha1="da39a3ee5e6b4b0d3255bfef95601890afd80709",
+            name="hello",
+            vendor=["LLNL"],
+            installPath=["/usr/bin/hello", "/bin/hello"],
+            containerPath=["dd6f7f6b-7c31-4a4a-afef-14678b9942bf/usr/bin/hello"],
+            metadata=[{"FileInfo": {"LegalCopyright": "Copyright 2024"}}],
+        )
+    )
+    sbom.add_software(
+        Software(
+            sha1="1234",
+            fileName=["lib.so"],
+            containerPath=["dd6f7f6b-7c31-4a4a-afef-14678b9942bf/lib/lib.so"],
+        )
+    )
+    # entries without any paths or file names don't get any rows
+    sbom.add_software(Software(sha1="5678"))
+    outpath = tmp_path / "sbom.parquet"
+    with open(outpath, "w") as outfile:
+        surfactantplugin_parquet.write_sbom(sbom, outfile)
+
+    rows = pq.read_table(outpath).to_pylist()
+    assert [row["Path"] for row in rows] == ["/usr/bin/hello", "/bin/hello", "lib/lib.so"]
+    assert [row["SHA1"] for row in rows] == [
+        "da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "da39a3ee5e6b4b0d3255bfef95601890afd80709",
+        "1234",
+    ]
+    assert rows[0]["Supplier"] == ["LLNL"]
+    assert rows[0]["Product"] == "hello"
+    assert rows[0]["Copyright"] == "Copyright 2024"
+    assert rows[2]["Copyright"] is None
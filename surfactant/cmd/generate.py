@@ -6,8 +6,7 @@ import json
 import os
 import pathlib
 import queue
-import re
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import click
 from loguru import logger
@@ -17,10 +16,31 @@ from surfactant.plugin.manager import find_io_plugin, get_plugin_manager
 from surfactant.relationships import parse_relationships
 from surfactant.sbomtypes import SBOM, Software
 
+# Paths from os.path.join/os.scandir only need separators converted on Windows
+_OS_SEP_IS_SLASH = os.sep == "/"
+
+# Software entry fields that are set from the Windows PE FileInfo (version info) metadata
+_FILEINFO_FIELDS = (
+    ("ProductName", "name"),
+    ("FileVersion", "version"),
+    ("FileDescription", "description"),
+    ("Comments", "comments"),
+)
+
+# Software entry fields that are set from OLE file metadata
+_OLE_FIELDS = (
+    ("subject", "name"),
+    ("revision_number", "version"),
+    ("comments", "comments"),
+)
+
 
 # Converts from a true path to an install path
 def real_path_to_install_path(root_path: str, install_path: str, filepath: str) -> str:
-    return re.sub("^" + root_path + "/", install_path, filepath)
+    prefix = root_path + "/"
+    if filepath.startswith(prefix):
+        return install_path + filepath[len(prefix) :]
+    return filepath
 
 
 def get_software_entry(
@@ -38,7 +58,10 @@ def get_software_entry(
     if root_path and install_path:
         sw_entry.installPath = [real_path_to_install_path(root_path, install_path, filepath)]
     if root_path and container_uuid:
-        sw_entry.containerPath = [re.sub("^" + root_path, container_uuid, filepath)]
+        if filepath.startswith(root_path):
+            sw_entry.containerPath = [container_uuid + filepath[len(root_path) :]]
+        else:
+            sw_entry.containerPath = [filepath]
     sw_entry.recordedInstitution = user_institution_name
     sw_children = []
 
@@ -59,28 +82,21 @@ def get_software_entry(
         # common case is Windows PE file has these details under FileInfo, otherwise fallback default value is fine
         if "FileInfo" in file_details:
             fi = file_details["FileInfo"]
-            if "ProductName" in fi:
-                sw_entry.name = fi["ProductName"]
-            if "FileVersion" in fi:
-                sw_entry.version = fi["FileVersion"]
-            if "CompanyName" in fi:
-                sw_entry.vendor = [fi["CompanyName"]]
-            if "FileDescription" in fi:
-                sw_entry.description = fi["FileDescription"]
-            if "Comments" in fi:
-                sw_entry.comments = fi["Comments"]
+            for fi_key, sw_field in _FILEINFO_FIELDS:
+                if (value := fi.get(fi_key)) is not None:
+                    setattr(sw_entry, sw_field, value)
+            if (company := fi.get("CompanyName")) is not None:
+                sw_entry.vendor = [company]
 
         # less common: OLE file metadata that might be relevant
-        if filetype == "OLE":
+        if filetype == "OLE" and "ole" in file_details:
             logger.trace("-----------OLE--------------")
-            if "subject" in file_details["ole"]:
-                sw_entry.name = file_details["ole"]["subject"]
-            if "revision_number" in file_details["ole"]:
-                sw_entry.version = file_details["ole"]["revision_number"]
-            if "author" in file_details["ole"]:
-                sw_entry.vendor.append(file_details["ole"]["author"])
-            if "comments" in file_details["ole"]:
-                sw_entry.comments = file_details["ole"]["comments"]
+            ole = file_details["ole"]
+            for ole_key, sw_field in _OLE_FIELDS:
+                if (value := ole.get(ole_key)) is not None:
+                    setattr(sw_entry, sw_field, value)
+            if (author := ole.get("author")) is not None:
+                sw_entry.vendor.append(author)
     return (sw_entry, sw_children)
 
 
@@ -124,6 +140,12 @@ def print_input_formats(ctx, _, value):
 def warn_if_hash_collision(soft1: Optional[Software], soft2: Optional[Software]):
     if not soft1 or not soft2:
         return
+    # Common case is the same file being seen again; check that with one tuple comparison
+    # before looking at the hashes individually
+    file1 = (soft1.sha256, soft1.sha1, soft1.md5, soft1.size)
+    file2 = (soft2.sha256, soft2.sha1, soft2.md5, soft2.size)
+    if file1 == file2:
+        return
     # A hash collision occurs if one or more but less than all hashes match or
     # any hash matches but the filesize is different
     collision = False
@@ -138,8 +160,11 @@ def warn_if_hash_collision(soft1: Optional[Software], soft2: Optional[Software])
         elif soft1.size != soft2.size:
             collision = True
     if collision:
+        # let loguru format the message, so it is skipped when warnings aren't being logged
         logger.warning(
-            f"Hash collision between {soft1.name} and {soft2.name}; unexpected results may occur"
+            "Hash collision between {} and {}; unexpected results may occur",
+            soft1.name,
+            soft2.name,
         )
 
 
@@ -242,7 +267,8 @@ def sbom(
     if not validate_config(config):
         return
 
-    context = queue.Queue()
+    # only accessed from this thread, so skip the locking done by queue.Queue
+    context = queue.SimpleQueue()
 
     for entry in config:
         context.put(ContextEntry(**entry))
@@ -293,13 +319,13 @@ def sbom(
                 if epath.endswith("/"):
                     epath = epath[:-1]
                 logger.trace("Extracted Path: " + str(epath))
-                for cdir, dirs, files in os.walk(epath):
+                for cdir, dirs, files in walk_dir_entries(epath):
                     logger.info("Processing " + str(cdir))
 
                     if entry.installPrefix:
                         for dir_ in dirs:
-                            full_path = os.path.join(cdir, dir_)
-                            if os.path.islink(full_path):
+                            if is_symlink_entry(dir_):
+                                full_path = dir_.path
                                 dest = resolve_link(full_path, cdir, epath, entry.installPrefix)
                                 if dest is not None:
                                     install_source = real_path_to_install_path(
@@ -314,10 +340,10 @@ def sbom(
                     for f in files:
                         # os.path.join will insert an OS specific separator between cdir and f
                         # need to make sure that separator is a / and not a \ on windows
-                        filepath = pathlib.Path(cdir, f).as_posix()
+                        filepath = f.path if _OS_SEP_IS_SLASH else f.path.replace("\\", "/")
                         file_is_symlink = False
                         # TODO: add CI tests for generating SBOMs in scenarios with symlinks... (and just generally more CI tests overall...)
-                        if os.path.islink(filepath):
+                        if is_symlink_entry(f):
                             true_filepath = resolve_link(filepath, cdir, epath, entry.installPrefix)
                             # Dead/infinite links will error so skip them
                             if true_filepath is None:
@@ -393,11 +419,21 @@ def sbom(
                             else:
                                 existing_uuid, entry_uuid = existing_sw.merge(e)
                                 # go through relationships and see if any need existing entries updated for the replaced uuid (e.g. merging SBOMs)
-                                for rel in new_sbom.relationships:
-                                    if rel.xUUID == entry_uuid:
-                                        rel.xUUID = existing_uuid
-                                    if rel.yUUID == entry_uuid:
-                                        rel.yUUID = existing_uuid
+                                # relationships are hashed by their fields, so take them out of the set while updating
+                                # them; adding them back in bulk also drops any that are now duplicates
+                                stale_rels = [
+                                    rel
+                                    for rel in new_sbom.relationships
+                                    if entry_uuid in (rel.xUUID, rel.yUUID)
+                                ]
+                                if stale_rels:
+                                    new_sbom.relationships.difference_update(stale_rels)
+                                    for rel in stale_rels:
+                                        if rel.xUUID == entry_uuid:
+                                            rel.xUUID = existing_uuid
+                                        if rel.yUUID == entry_uuid:
+                                            rel.yUUID = existing_uuid
+                                    new_sbom.relationships.update(stale_rels)
                                 # add a new contains relationship if the duplicate file is from a different container/archive than previous times seeing the file
                                 if parent_entry:
                                     parent_uuid = parent_entry.UUID
@@ -412,10 +448,10 @@ def sbom(
                                 # TODO a pass later on to check for and remove duplicate relationships should be added just in case
 
         # Add file symlinks to install paths
-        for software in new_sbom.software:
-            if software.sha256 in file_symlinks:
+        for sha256, symlink_paths in file_symlinks.items():
+            if software := new_sbom.find_software(sha256):
                 symlinks_added = []
-                for full_path in file_symlinks[software.sha256]:
+                for full_path in symlink_paths:
                     if full_path not in software.installPath:
                         software.installPath.append(full_path)
                         symlinks_added.append(full_path)
@@ -427,17 +463,29 @@ def sbom(
                     software.metadata.append({"installPathSymlinks": symlinks_added})
 
         # Add directory symlink destinations to extract/install paths
+        # Index the symlinks by destination so each path only needs one lookup per distinct
+        # destination length, instead of a startswith check against every symlink
+        symlinks_by_dest: Dict[str, List[Tuple[int, str]]] = {}
+        for idx, (link_source, link_dest) in enumerate(dir_symlinks):
+            symlinks_by_dest.setdefault(link_dest, []).append((idx, link_source))
+        dest_lengths = sorted({len(link_dest) for link_dest in symlinks_by_dest})
         for software in new_sbom.software:
             # NOTE: this probably doesn't actually add any containerPath symlinks
             for paths in (software.containerPath, software.installPath):
                 paths_to_add = []
                 for path in paths:
-                    for link_source, link_dest in dir_symlinks:
-                        if path.startswith(link_dest):
+                    matches = []
+                    for dest_len in dest_lengths:
+                        if dest_len > len(path):
+                            break
+                        for idx, link_source in symlinks_by_dest.get(path[:dest_len], ()):
                             # Replace the matching start with the symlink instead
                             # We can't use os.path.join here because we end up with absolute paths after
                             # removing the common start.
-                            paths_to_add.append(path.replace(link_dest, link_source, 1))
+                            matches.append((idx, link_source + path[dest_len:]))
+                    # keep the order the symlinks were found in
+                    matches.sort()
+                    paths_to_add += [new_path for _, new_path in matches]
                 if paths_to_add:
                     found_md_installpathsymlinks = False
                     for md in software.metadata:
@@ -460,6 +508,59 @@ def sbom(
     output_writer.write_sbom(new_sbom, sbom_outfile)
 
 
+def walk_dir_entries(top: str) -> Iterator[Tuple[str, List[os.DirEntry], List[os.DirEntry]]]:
+    """Walk a directory tree top-down like os.walk, without following directory symlinks.
+
+    Unlike os.walk, the directories and files are yielded as the os.DirEntry objects from
+    os.scandir, so the file type information cached in them can be used instead of issuing
+    another stat call for every entry. Directories that can't be read are skipped.
+
+    Args:
+        top (str): The directory to start walking from.
+
+    Returns:
+        Iterator[Tuple[str, List[os.DirEntry], List[os.DirEntry]]]: Tuples of the current directory,
+        the directories in it (including symlinks to directories), and the other entries in it.
+    """
+    stack = [top]
+    while stack:
+        cdir = stack.pop()
+        dirs: List[os.DirEntry] = []
+        files: List[os.DirEntry] = []
+        try:
+            with os.scandir(cdir) as it:
+                for dir_entry in it:
+                    try:
+                        is_dir = dir_entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        dirs.append(dir_entry)
+                    else:
+                        files.append(dir_entry)
+        except OSError:
+            continue
+        yield cdir, dirs, files
+        # push in reverse so subdirectories are visited in the same order as os.walk
+        stack.extend(d.path for d in reversed(dirs) if not is_symlink_entry(d))
+
+
+def is_symlink_entry(dir_entry: os.DirEntry) -> bool:
+    """Check if an os.scandir entry is a symlink, treating entries that can't be checked (e.g.
+    ones that were removed during the walk) as not being symlinks, like os.path.islink and os.walk.
+
+    Args:
+        dir_entry (os.DirEntry): The directory entry to check.
+
+    Returns:
+        bool: True if the entry is a symlink.
+    """
+    try:
+        return dir_entry.is_symlink()
+    except OSError:
+        return False
+
+
 def resolve_link(
     path: str, cur_dir: str, extract_dir: str, install_prefix: str = None
 ) -> Union[str, None]:
@@ -477,7 +578,7 @@ def resolve_link(
         seen_paths.add(current_path)
         dest = os.readlink(current_path)
         # Convert relative paths to absolute local paths
-        if not pathlib.Path(dest).is_absolute():
+        if not os.path.isabs(dest):
             common_path = os.path.commonpath([cur_dir, extract_dir])
             local_path = os.path.join("/", cur_dir[len(common_path) :])
             dest = os.path.join(local_path, dest)
@@ -487,7 +588,7 @@ def resolve_link(
         if install_prefix and dest.startswith(install_prefix):
             dest = dest[len(install_prefix) :]
         # We need to get a non-absolute path so os.path.join works as we want
-        if pathlib.Path(dest).is_absolute():
+        if os.path.isabs(dest):
             # TODO: Windows support, but how???
             dest = dest[1:]
         # Rebase to get the true location
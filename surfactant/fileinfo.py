@@ -6,6 +6,10 @@ import os
 import stat
 from hashlib import md5, sha1, sha256
 
+# Size of the reads used when hashing files; large enough that a typical binary is hashed
+# with only a handful of read syscalls
+HASH_READ_BLOCK_SIZE = 1 << 17
+
 
 def get_file_info(filename):
     """Get information about a file.
@@ -55,14 +59,21 @@ def calc_file_hashes(filename):
     sha256_hash = sha256()
     sha1_hash = sha1()
     md5_hash = md5()
-    b = bytearray(4096)
+    b = bytearray(HASH_READ_BLOCK_SIZE)
     mv = memoryview(b)
     try:
         with open(filename, "rb", buffering=0) as f:
+            if hasattr(os, "posix_fadvise"):
+                # the whole file is read front to back, so let the kernel read ahead aggressively
+                try:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass
             while n := f.readinto(mv):
-                sha256_hash.update(mv[:n])
-                sha1_hash.update(mv[:n])
-                md5_hash.update(mv[:n])
+                chunk = mv[:n]
+                sha256_hash.update(chunk)
+                sha1_hash.update(chunk)
+                md5_hash.update(chunk)
     except FileNotFoundError:
         return None
     return {
@@ -3,37 +3,38 @@
 #
 # SPDX-License-Identifier: MIT
 import pathlib
-import re
 from typing import Optional
 
 from loguru import logger
 
 import surfactant.plugin
 
+_filetype_extensions = {
+    ".sh": "SHELL",
+    ".bash": "BASH",
+    ".zsh": "ZSH",
+    ".py": "PYTHON",
+    ".pyc": "PYTHON_COMPILED",
+    ".js": "JAVASCRIPT",
+    ".css": "CSS",
+    ".html": "HTML",
+    ".htm": "HTML",
+    ".php": "PHP",
+}
+
+_interpreters = {
+    b"sh": "SHELL",
+    b"bash": "BASH",
+    b"zsh": "ZSH",
+    b"php": "PHP",
+    b"python": "PYTHON",
+    b"python3": "PYTHON",
+}
+
 
 @surfactant.plugin.hookimpl
 def identify_file_type(filepath: str) -> Optional[str]:
     # pylint: disable=too-many-return-statements
-    _filetype_extensions = {
-        ".sh": "SHELL",
-        ".bash": "BASH",
-        ".zsh": "ZSH",
-        ".py": "PYTHON",
-        ".pyc": "PYTHON_COMPILED",
-        ".js": "JAVASCRIPT",
-        ".css": "CSS",
-        ".html": "HTML",
-        ".htm": "HTML",
-        ".php": "PHP",
-    }
-    _interpreters = {
-        b"sh": "SHELL",
-        b"bash": "BASH",
-        b"zsh": "ZSH",
-        b"php": "PHP",
-        b"python": "PYTHON",
-        b"python3": "PYTHON",
-    }
     try:
         with open(filepath, "rb") as f:
             head = f.read(256)
@@ -43,7 +44,7 @@ def identify_file_type(filepath: str) -> Optional[str]:
                 end_line = head.index(b"\n")
                 head = head[:end_line]
                 for interpreter, filetype in _interpreters.items():
-                    if re.search(interpreter, head):
+                    if interpreter in head:
                         return filetype
                 return "SHEBANG"
     except FileNotFoundError:
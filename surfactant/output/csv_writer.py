@@ -3,9 +3,10 @@
 #
 # SPDX-License-Identifier: MIT
 import csv
+import io
 import os
 from collections.abc import Iterable
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import surfactant.plugin
 from surfactant.sbomtypes import SBOM, Software
@@ -20,19 +21,48 @@ default_fields = [
     "Copyright",
 ]
 
+# Number of characters of CSV output to collect before writing them to the output file
+write_chunk_size = 1 << 20
+
+# CSV field names that differ from the name of the corresponding SBOM field
+# NOTE: the parquet output plugin (plugins/parquet) imports field_name_map and get_software_field,
+# so renaming either of them will break that plugin
+field_name_map = {
+    "SHA1": "sha1",
+    "SHA256": "sha256",
+    "MD5": "md5",
+    "Version": "version",
+    "Description": "description",
+    "Product": "name",
+    "Supplier": "vendor",
+}
+
 
 @surfactant.plugin.hookimpl
 def write_sbom(sbom: SBOM, outfile) -> None:
     # plugin args could be handled here to change behavior
     fields = default_fields
 
+    # normalize some special field names to actual SBOM field names; the fields are the same
+    # for every software entry, so only do this once instead of for every entry
+    field_pairs = [(f, field_name_map.get(f, f)) for f in fields]
+    path_idx = fields.index("Path") if "Path" in fields else None
+
     # match output format with pandas.DataFrame.to_csv
     # equivalent to `excel` dialect, other than lineterminator
-    writer = csv.DictWriter(outfile, fieldnames=fields, lineterminator=os.linesep)
-    writer.writeheader()
+    # rows are formatted into an in-memory buffer and written to outfile in large chunks, so small
+    # SBOMs take a single write and large ones don't need the whole CSV in memory at once
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator=os.linesep)
+    writer.writerow(fields)
     if sbom.software:
         for sw in sbom.software:
-            write_software_entry(writer, sw, fields)
+            write_software_entry(writer, sw, field_pairs, path_idx)
+            if buf.tell() >= write_chunk_size:
+                outfile.write(buf.getvalue())
+                buf.seek(0)
+                buf.truncate()
+    outfile.write(buf.getvalue())
 
 
 @surfactant.plugin.hookimpl
@@ -40,38 +70,41 @@ def short_name() -> Optional[str]:
     return "csv"
 
 
-def write_software_entry(writer: csv.DictWriter, software: Software, fields: List[str]):
+def write_software_entry(
+    writer, software: Software, field_pairs: List[Tuple[str, str]], path_idx: Optional[int]
+):
     # last resort, use the fileName instead of an actual path to output csv entries
     pathkey = "fileName"
-    if "Path" in fields:
+    if path_idx is not None:
         if software.installPath and isinstance(software.installPath, Iterable):
             # default to using "installPath"
             pathkey = "installPath"
         elif software.containerPath and isinstance(software.containerPath, Iterable):
             # use "containerPath" if it has entries but "installPath" does not
             pathkey = "containerPath"
+    paths = getattr(software, pathkey)
+    # no rows to write for an entry without any paths or file names
+    if not paths:
+        return
+
+    # the field values are the same for every path, so look them up (and search the metadata
+    # for a Copyright) once per software entry; Path is different for each row and gets filled in below
+    field_values = [
+        None if f == "Path" else get_software_field(software, fld_norm)
+        for f, fld_norm in field_pairs
+    ]
+
+    # if containerPath is being used, remove the UUID portion at the start of each path
+    strip_container_uuid = pathkey == "containerPath"
 
     # an entry will be created for every entry with a valid path
-    for p in getattr(software, pathkey):
-        row = {}
-        row["Path"] = p
-        # if containerPath is being used, remove the UUID portion at the start
-        if pathkey == "containerPath":
-            row["Path"] = "".join(row["Path"].split("/")[1:])
-        for f in fields:
-            # Path already added to row info
-            if f == "Path":
-                continue
-            # normalize some special field names to actual SBOM field names
-            fld_norm = f
-            if f in ("SHA1", "SHA256", "MD5", "Version", "Description"):
-                fld_norm = str.lower(f)
-            elif f == "Product":
-                fld_norm = "name"
-            elif f == "Supplier":
-                fld_norm = "vendor"
-            row[f] = get_software_field(software, fld_norm)
-        writer.writerow(row)
+    rows = []
+    for p in paths:
+        row = field_values.copy()
+        if path_idx is not None:
+            row[path_idx] = p.partition("/")[2] if strip_container_uuid else p
+        rows.append(row)
+    writer.writerows(rows)
 
 
 def get_software_field(software, field):
@@ -80,7 +113,6 @@ def get_software_field(software, field):
     # Copyright field currently only gets populated from Windows PE file metadata
     if field == "Copyright":
         if software.metadata and isinstance(software.metadata, Iterable):
-            retval = []
             for entry in software.metadata:
                 if "FileInfo" in entry and "LegalCopyright" in entry["FileInfo"]:
                     return entry["FileInfo"]["LegalCopyright"]
@@ -3,7 +3,7 @@
 #
 # SPDX-License-Identifier: MIT
 
-from queue import Queue
+from queue import SimpleQueue
 from typing import List, Optional
 
 from pluggy import HookspecMarker
@@ -34,7 +34,7 @@ def extract_file_info(
     software: Software,
     filename: str,
     filetype: str,
-    context: "Queue[ContextEntry]",
+    context: "SimpleQueue[ContextEntry]",
     children: List[Software],
 ) -> Optional[list]:
     """Extracts information from the given file to add to the given software entry. Return an
@@ -47,7 +47,7 @@ def extract_file_info(
         software (Software): The software entry the gathered information will be added to.
         filename (str): The full path to the file to extract information from.
         filetype (str): File type information based on magic bytes.
-        context (Queue[ContextEntry]): Modifiable queue of entries from input config file. Existing plugins should still work without adding this parameter.
+        context (SimpleQueue[ContextEntry]): Modifiable queue of entries from input config file. Existing plugins should still work without adding this parameter.
         children (List[Software]): List of additional software entries to include in the SBOM. Plugins can add additional entries, though if the plugin extracts files to a temporary directory, the context argument should be used to have Surfactant process the files instead.
 
     Returns:
@@ -40,6 +40,11 @@ class SBOM:
         self.__dataclass_fields__ = {
             k: v for k, v in self.__dataclass_fields__.items() if k not in INTERNAL_FIELDS
         }
+        # software entries loaded from an existing SBOM bypass add_software, so index them here;
+        # keep the first entry for a hash, matching the linear search in _find_software_entry
+        for sw in self.software:
+            if sw.sha256 is not None:
+                self.software_lookup_by_sha256.setdefault(sw.sha256, sw)
 
     def add_relationship(self, rel: Relationship) -> None:
         self.relationships.add(rel)
@@ -123,8 +128,7 @@ class SBOM:
             recordedInstitution=recordedInstitution,
             components=components,
         )
-        self.software_lookup_by_sha256[sw.sha256] = sw
-        self.software.append(sw)
+        self.add_software(sw)
         return sw
 
     def merge(self, sbom_m: SBOM) -> SBOM:
@@ -155,7 +159,7 @@ class SBOM:
                     logger.info(f"MERGE DUPLICATE: uuid1={u1}, uuid2={u2}")
                     uuid_updates[u2] = u1
                 else:
-                    self.software.append(sw)
+                    self.add_software(sw)
 
         # merge relationships
         if sbom_m.relationships:
@@ -165,12 +169,9 @@ class SBOM:
                     rel.xUUID = uuid_updates[rel.xUUID]
                 if rel.yUUID in uuid_updates:
                     rel.yUUID = uuid_updates[rel.yUUID]
-                if existing_rel := self._find_relationship_entry(
-                    xUUID=rel.xUUID,
-                    yUUID=rel.yUUID,
-                    relationship=rel.relationship,
-                ):
-                    logger.info(f"DUPLICATE RELATIONSHIP: {existing_rel}")
+                # relationships compare and hash by value, so this is a set lookup
+                if rel in self.relationships:
+                    logger.info(f"DUPLICATE RELATIONSHIP: {rel}")
                 else:
                     self.relationships.add(rel)
 
@@ -203,12 +204,9 @@ class SBOM:
                     rel.xUUID = uuid_updates[rel.xUUID]
                 if rel.yUUID in uuid_updates:
                     rel.yUUID = uuid_updates[rel.yUUID]
-                if existing_rel := self._find_star_relationship_entry(
-                    xUUID=rel.xUUID,
-                    yUUID=rel.yUUID,
-                    relationship=rel.relationship,
-                ):
-                    logger.info(f"DUPLICATE STAR RELATIONSHIP: {existing_rel}")
+                # relationships compare and hash by value, so this is a set lookup
+                if rel in self.starRelationships:
+                    logger.info(f"DUPLICATE STAR RELATIONSHIP: {rel}")
                 else:
                     self.starRelationships.add(rel)
 
@@ -254,6 +252,8 @@ class SBOM:
         Returns:
             Optional[Software]: The software entry found that matches the given criteria, otherwise None.
         """
+        if sha256 and sha256 in self.software_lookup_by_sha256:
+            return self.software_lookup_by_sha256[sha256]
         for sw in self.software:
             match = False
             # If we have hashes to check
@@ -276,66 +276,6 @@ class SBOM:
                 return sw
         return None
 
-    def _find_relationship_entry(
-        self,
-        xUUID: Optional[str] = None,
-        yUUID: Optional[str] = None,
-        relationship: Optional[str] = None,
-    ) -> Optional[Relationship]:
-        """Merge helper function to find and return
-        the matching relationship entry in the provided sbom.
-
-        Args:
-            xUUID (Optional[str]): The xUUID of the desired relationship entry.
-            yUUID (Optional[str]): The yUUID of the desired relationship entry.
-            relationship (Optional[str]): The relationship type of the desired relationship entry.
-
-        Returns:
-            Optional[Relationship]: The relationship entry found that matches the given criteria, otherwise None.
-        """
-        for rel in self.relationships:
-            if xUUID:
-                if rel.xUUID != xUUID:
-                    continue
-            if yUUID:
-                if rel.yUUID != yUUID:
-                    continue
-            if relationship:
-                if rel.relationship != relationship:
-                    continue
-            return rel
-        return None
-
-    def _find_star_relationship_entry(
-        self,
-        xUUID: Optional[str] = None,
-        yUUID: Optional[str] = None,
-        relationship: Optional[str] = None,
-    ) -> Optional[StarRelationship]:
-        """Merge helper function to find and return
-        the matching star relationship entry in the provided sbom.
-
-        Args:
-            xUUID (Optional[str]): The xUUID of the desired relationship entry.
-            yUUID (Optional[str]): The yUUID of the desired relationship entry.
-            relationship (Optional[str]): The relationship type of the desired relationship entry.
-
-        Returns:
-            Optional[StarRelationship]: The star relationship found that matches the given criteria, otherwise None.
-        """
-        for rel in self.starRelationships:
-            if xUUID:
-                if rel.xUUID != xUUID:
-                    continue
-            if yUUID:
-                if rel.yUUID != yUUID:
-                    continue
-            if relationship:
-                if rel.relationship != relationship:
-                    continue
-            return rel
-        return None
-
     def is_valid_uuid4(self, u: str) -> bool:
         """Merge helper function to check if a uuid is valid.
 
@@ -1,7 +1,10 @@
 import json
+import shutil
 from pathlib import Path
 
-from surfactant.cmd.generate import sbom
+import surfactant.cmd.generate
+import surfactant.plugin
+from surfactant.cmd.generate import real_path_to_install_path, sbom
 
 testing_data = Path(Path(__file__).parent.parent, "data")
 
@@ -111,3 +114,86 @@ def test_generate_with_skip_install_path(tmp_path):
         assert software["installPath"] == []
 
     assert len(generated_sbom["relationships"]) == 0
+
+
+class RelationshipRecorder:
+    """Test plugin that adds relationships for every file and keeps the generated SBOM."""
+
+    def __init__(self):
+        self.sbom = None
+
+    @surfactant.plugin.hookimpl
+    def extract_file_info(self, sbom, software, filename):
+        # the same for every copy of a file, so it becomes a duplicate when the copies are merged
+        sbom.create_relationship(software.UUID, "shared-dependency", "Uses")
+        sbom.create_relationship(software.UUID, f"dependency-of-{Path(filename).name}", "Uses")
+
+    @surfactant.plugin.hookimpl
+    def write_sbom(self, sbom, outfile):
+        self.sbom = sbom
+
+    @surfactant.plugin.hookimpl
+    def short_name(self):
+        return "relationship_recorder"
+
+
+def test_generate_rewrites_relationships_of_duplicate_files(tmp_path, monkeypatch):
+    extract_path = Path(tmp_path, "extract")
+    extract_path.mkdir()
+    for name in ("a.exe", "b.exe"):
+        shutil.copy(
+            Path(testing_data, "Windows_dll_test_no1", "hello_world.exe"), extract_path / name
+        )
+    config_path = str(Path(tmp_path, "config.json"))
+    output_path = str(Path(tmp_path, "out.json"))
+
+    with open(config_path, "w") as f:
+        f.write(f'[{{"extractPaths": ["{extract_path.as_posix()}"]}}]')
+
+    recorder = RelationshipRecorder()
+    get_plugin_manager = surfactant.cmd.generate.get_plugin_manager
+
+    def get_plugin_manager_with_recorder():
+        pm = get_plugin_manager()
+        pm.register(recorder)
+        return pm
+
+    monkeypatch.setattr(
+        surfactant.cmd.generate, "get_plugin_manager", get_plugin_manager_with_recorder
+    )
+    # pylint: disable=no-value-for-parameter
+    sbom(
+        [
+            "--skip_relationships",
+            "--output_format",
+            "relationship_recorder",
+            config_path,
+            output_path,
+        ],
+        standalone_mode=False,
+    )
+    # pylint: enable
+
+    generated_sbom = recorder.sbom
+    assert len(generated_sbom.software) == 1
+    uuid = generated_sbom.software[0].UUID
+    # relationships added for the second copy now use the UUID of the entry it was merged into
+    for name in ("a.exe", "b.exe"):
+        assert generated_sbom.find_relationship(uuid, f"dependency-of-{name}", "Uses")
+    assert generated_sbom.find_relationship(uuid, "shared-dependency", "Uses")
+    assert not any(uuid not in (rel.xUUID, rel.yUUID) for rel in generated_sbom.relationships)
+    # both copies added the shared relationship, but it is only stored once after merging
+    assert len(generated_sbom.relationships) == 3
+
+
+def test_real_path_to_install_path():
+    assert (
+        real_path_to_install_path("/extract/dir", "/usr/", "/extract/dir/lib/libc.so")
+        == "/usr/lib/libc.so"
+    )
+    # regex metacharacters in the root path are matched literally
+    assert (
+        real_path_to_install_path("/extract/a+b.dir", "/usr/", "/extract/a+b.dir/bin/ls")
+        == "/usr/bin/ls"
+    )
+    assert real_path_to_install_path("/extract/dir", "/usr/", "/other/bin/ls") == "/other/bin/ls"
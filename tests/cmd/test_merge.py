@@ -162,6 +162,50 @@ def test_simple_merge_method():
     )
 
 
+def test_merge_indexes_software_by_sha256():
+    sbom_a = SBOM.from_json('{"software": [{"UUID": "a", "sha256": "1111"}]}')
+    assert sbom_a.find_software("1111") is sbom_a.software[0]
+    sbom_b = SBOM.from_json(
+        '{"software": [{"UUID": "b", "sha256": "2222"}, {"UUID": "c", "sha256": "1111"}]}'
+    )
+    sbom_a.merge(sbom_b)
+    assert [sw.UUID for sw in sbom_a.software] == ["a", "b"]
+    assert sbom_a.find_software("2222").UUID == "b"
+    # with duplicate hashes in a loaded SBOM, the first entry is found like a linear search would
+    sbom_c = SBOM.from_json(
+        '{"software": [{"UUID": "d", "sha256": "3333"}, {"UUID": "e", "sha256": "3333"}]}'
+    )
+    assert sbom_c.find_software("3333").UUID == "d"
+
+
+def test_merge_rewrites_relationship_uuids():
+    sbom_a = SBOM.from_json(
+        """{
+        "software": [{"UUID": "p"}, {"UUID": "a", "sha256": "1111"}],
+        "relationships": [{"xUUID": "p", "yUUID": "a", "relationship": "Contains"}]
+    }"""
+    )
+    # "c" is the same file as "a", so relationships involving it get rewritten to use "a"
+    sbom_b = SBOM.from_json(
+        """{
+        "software": [{"UUID": "p"}, {"UUID": "b", "sha256": "2222"}, {"UUID": "c", "sha256": "1111"}],
+        "relationships": [
+            {"xUUID": "p", "yUUID": "c", "relationship": "Contains"},
+            {"xUUID": "c", "yUUID": "b", "relationship": "Uses"}
+        ]
+    }"""
+    )
+    sbom_a.merge(sbom_b)
+    assert sbom_a.find_relationship("a", "b", "Uses")
+    assert not sbom_a.find_relationship("c", "b", "Uses")
+    # "p Contains c" became a duplicate of "p Contains a" and should only be present once
+    assert sbom_a.find_relationship("p", "a", "Contains")
+    assert sorted((r.xUUID, r.yUUID, r.relationship) for r in sbom_a.relationships) == [
+        ("a", "b", "Uses"),
+        ("p", "a", "Contains"),
+    ]
+
+
 @pytest.mark.skip(reason="No way of validating this test yet")
 def test_merge_with_circular_dependency():
     circular_dependency_sbom = sbom1
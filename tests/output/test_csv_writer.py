@@ -0,0 +1,87 @@
+# Copyright 2024 Lawrence Livermore National Security, LLC
+# See the top-level LICENSE file for details.
+#
+# SPDX-License-Identifier: MIT
+import csv
+import io
+
+from surfactant.output import csv_writer
+from surfactant.sbomtypes import SBOM, Software
+
+
+def write_csv(sbom: SBOM):
+    outfile = io.StringIO()
+    csv_writer.write_sbom(sbom, outfile)
+    return list(csv.DictReader(io.StringIO(outfile.getvalue())))
+
+
+def test_csv_row_per_install_path():
+    sbom = SBOM()
+    sbom.add_software(
+        Software(
+            sha1="da39a3ee5e6b4b0d3255bfef95601890afd80709",
+            name="hello",
+            vendor=["LLNL"],
+            version="1.0",
+            description='says "hello, world"',
+            installPath=["/usr/bin/hello", "/bin/hello"],
+            metadata=[{"FileInfo": {"LegalCopyright": "Copyright 2024"}}],
+        )
+    )
+    rows = write_csv(sbom)
+    assert [row["Path"] for row in rows] == ["/usr/bin/hello", "/bin/hello"]
+    for row in rows:
+        assert row["SHA1"] == "da39a3ee5e6b4b0d3255bfef95601890afd80709"
+        assert row["Product"] == "hello"
+        assert row["Version"] == "1.0"
+        assert row["Description"] == 'says "hello, world"'
+        assert row["Copyright"] == "Copyright 2024"
+
+
+def test_csv_container_path_strips_uuid():
+    sbom = SBOM()
+    sbom.add_software(
+        Software(
+            sha1="1234",
+            fileName=["hello"],
+            containerPath=["dd6f7f6b-7c31-4a4a-afef-14678b9942bf/usr/bin/hello"],
+        )
+    )
+    rows = write_csv(sbom)
+    assert [row["Path"] for row in rows] == ["usr/bin/hello"]
+
+
+def test_csv_skips_software_without_paths():
+    sbom = SBOM()
+    sbom.add_software(Software(sha1="1234"))
+    sbom.add_software(Software(sha1="5678", fileName=["hello"]))
+    rows = write_csv(sbom)
+    assert [row["Path"] for row in rows] == ["hello"]
+
+
+class WriteCountingIO(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.write_count = 0
+
+    def write(self, s):
+        self.write_count += 1
+        return super().write(s)
+
+
+def test_csv_output_written_in_chunks(monkeypatch):
+    sbom = SBOM()
+    for i in range(10):
+        sbom.add_software(Software(sha1=str(i), installPath=[f"/bin/file{i}"]))
+
+    outfile = WriteCountingIO()
+    csv_writer.write_sbom(sbom, outfile)
+    assert outfile.write_count == 1
+    expected = outfile.getvalue()
+
+    monkeypatch.setattr(csv_writer, "write_chunk_size", 16)
+    outfile = WriteCountingIO()
+    csv_writer.write_sbom(sbom, outfile)
+    assert outfile.write_count > 1
+    assert outfile.getvalue() == expected
+    assert len(list(csv.DictReader(io.StringIO(expected)))) == 10
@@ -8,7 +8,7 @@ import tempfile
 
 import pytest
 
-from surfactant.cmd.generate import resolve_link
+from surfactant.cmd.generate import is_symlink_entry, resolve_link, walk_dir_entries
 
 base_dir = pathlib.Path(__file__).parent.absolute()
 
@@ -59,5 +59,27 @@ def test_symlinks():
         )
 
 
+@pytest.mark.skipif(os.name != "posix", reason="requires posix os")
+def test_walk_dir_entries_matches_os_walk():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        create_symlinks(temp_dir)
+        base_path = os.path.realpath(os.path.join(temp_dir, "test_dir"))
+        pathlib.Path(base_path, "subdir", "file.txt").touch()
+        expected = [(cdir, sorted(dirs), sorted(files)) for cdir, dirs, files in os.walk(base_path)]
+        actual = [
+            (cdir, sorted(d.name for d in dirs), sorted(f.name for f in files))
+            for cdir, dirs, files in walk_dir_entries(base_path)
+        ]
+        assert actual == expected
+
+
+def test_is_symlink_entry_handles_os_error():
+    class VanishedEntry:
+        def is_symlink(self):
+            raise FileNotFoundError("removed during the walk")
+
+    assert not is_symlink_entry(VanishedEntry())
+
+
 if __name__ == "__main__":
     test_symlinks()